@@ -9,12 +9,16 @@ Date: January 01, 2025
 """
 
 import pyxel
+from collections import deque
 from paddle import Paddle
 from brick import Brick
-from math import ceil, radians, cos, sin
+from math import ceil, radians, cos, sin, hypot
 from random import choice
 
 
+TRAIL_COLORS: tuple[int, int, int] = (pyxel.COLOR_ORANGE, pyxel.COLOR_RED, pyxel.COLOR_YELLOW)  # colors of trail particles
+
+
 class Ball:
     """ 
     
@@ -31,7 +35,7 @@ class Ball:
         VELOCITY_INCREASE (float):              amount the speed of the ball increases
         MAX_SPEED (float):                      caps the speed of the ball
         r (int):                                radius of the ball
-        trail (list[tuple[float, float]]):      contains past positions of the ball
+        trail (deque[tuple[float, float]]):     contains past positions of the ball (oldest dropped automatically)
         trail_margin (float):                   trail deviation
         trail_length (float):                   how many positions are kept track of for the trail
         img (int):                              img bank of the sprite
@@ -101,6 +105,13 @@ class Ball:
 
             
     """
+    __slots__ = (
+        "x", "y", "direction_x", "direction_y", "speed_x", "speed_y", "gravity",
+        "VELOCITY_INCREASE", "MAX_SPEED", "r", "trail_margin", "trail_length", "trail", "img",
+        "sprite_u", "sprite_v", "sprite_change_interval", "last_sprite_change", "destroy_brick",
+        "out_of_bounds",
+    )
+
     def __init__(self, gravity: float) -> None:
         """ Constructor for ball """
         # position and movement
@@ -117,9 +128,9 @@ class Ball:
         self.r: int = 4 
         
         # ball trail
-        self.trail: list[tuple[float, float]] = []          # list of past positions of ball for trail
         self.trail_margin: float = 3                        # how far the randomized particle will be at most
         self.trail_length: int = 10
+        self.trail: deque[tuple[float, float]] = deque(maxlen=self.trail_length)  # past positions of ball for trail
 
         # appearance of ball
         self.img: int = 0 
@@ -186,11 +197,11 @@ class Ball:
  
         angle_radians = radians(angle)
 
-        curr_magnitude = (self.speed_x**2 + self.speed_y**2)**0.5
+        curr_magnitude = hypot(self.speed_x, self.speed_y)
         self.speed_x = curr_magnitude * cos(angle_radians)
         self.speed_y = -curr_magnitude * sin(angle_radians) # negative to align with upward motion
 
-        if angle in [90, 270]:                              # straight up or down
+        if angle in (90, 270):                              # straight up or down
                                                             # adds slight variation to `x` speed to ensure ball is always in play
             self.speed_x += (-0.1 if self.direction_x == -1 else 0.1)
 
@@ -261,7 +272,7 @@ class Ball:
                                 pass
 
                                                             # applies speed cap and proportional increase
-            curr_magnitude = (self.speed_x**2 + self.speed_y**2)**0.5
+            curr_magnitude = hypot(self.speed_x, self.speed_y)
             new_magnitude = min(curr_magnitude + self.VELOCITY_INCREASE, self.MAX_SPEED)
             speed_ratio = new_magnitude / curr_magnitude
             self.speed_x *= speed_ratio
@@ -291,9 +302,9 @@ class Ball:
 
     def _update_trail(self) -> None:
         """ Updates the ball's trail """
-        self.trail.append((self.x, self.y))                 # stores the current position in the trail
-        if len(self.trail) > self.trail_length:
-            self.trail.pop(0)
+        if abs(self.speed_x) + abs(self.speed_y) < 0.01:    # (almost) not moving, nothing new to trail
+            return
+        self.trail.append((self.x, self.y))                 # stores the current position (drops the oldest when full)
 
     def clear_trails(self) -> None:
         """ Clears all ball trails """
@@ -340,12 +351,14 @@ class Ball:
 
     def _draw_trail(self) -> None:
         """ Draws the shimmering trail effect """
+        circb, rndi = pyxel.circb, pyxel.rndi               # local lookups inside the loop
+        margin = self.trail_margin
         for trail_x, trail_y in self.trail:
-            pyxel.circb(
-                x=pyxel.rndi(ceil(trail_x - self.trail_margin), ceil(trail_x + self.trail_margin)),
-                y=pyxel.rndi(int(trail_y), ceil(trail_y + self.trail_margin)),
+            circb(
+                x=rndi(ceil(trail_x - margin), ceil(trail_x + margin)),
+                y=rndi(int(trail_y), ceil(trail_y + margin)),
                 r=0.5,
-                col=choice([pyxel.COLOR_ORANGE, pyxel.COLOR_RED, pyxel.COLOR_YELLOW])
+                col=choice(TRAIL_COLORS)
             )
 
     def _draw_ball(self) -> None:
@@ -88,7 +88,10 @@ class Brick:
             Renders the brick sprite.
 
     """
-
+    __slots__ = (
+        "brick_type", "x", "y", "w", "h", "health", "img", "colkey", "skins_1", "skins_2",
+        "skins_3", "skins_4", "current_skin", "K",
+    )
 
     def __init__(self, x: float, y: float, brick_type: int, K: int) -> None:
         """ Constructor for brick """
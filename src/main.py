@@ -11,8 +11,11 @@ Date: January 01, 2025
 
 import pyxel
 import json
+from array import array
+import os
+import pickle
+from collections.abc import Callable
 from dataclasses import dataclass
-from enum import Enum, auto
 from math import radians, sin, cos
 from random import choice
 
@@ -23,10 +26,14 @@ from paddle import Paddle
 from brick import Brick
 from sounds import Sounds
 
-class GameState(Enum):
+                                                                # sin/cos lookup tables for whole-degree angles (0 to 360)
+_COS: tuple[float, ...] = tuple(cos(radians(a)) for a in range(0, 361))
+_SIN: tuple[float, ...] = tuple(sin(radians(a)) for a in range(0, 361))
+
+class GameState:
     """ 
     
-    Defines possible game states.
+    Defines possible game states (plain ints, so comparisons and table lookups stay cheap).
 
     States:
         START:                  Starts game
@@ -37,13 +44,13 @@ class GameState(Enum):
         GAME_OVER:              Player has lost
         WIN:                    Player has won
     """
-    START = auto() 
-    READY = auto()  
-    RUNNING = auto() 
-    DROPPED = auto() 
-    STAGE_TRANSITION = auto() 
-    GAME_OVER = auto() 
-    WIN = auto() 
+    START: int = 0 
+    READY: int = 1  
+    RUNNING: int = 2 
+    DROPPED: int = 3 
+    STAGE_TRANSITION: int = 4 
+    GAME_OVER: int = 5 
+    WIN: int = 6 
 
 @dataclass
 class GameStats:
@@ -65,22 +72,28 @@ class BreakoutGame:
     Main game controller class for Breakout implementation.
     
     Attributes:
+        _background_img (pyxel.Image):                          background already scaled to the screen size
         gravity (float):                                        gravity felt by game elements
         paddle (Paddle):                                        player-controlled paddle object
         original_paddle_speed (float):                          tracks original paddle speed
-        angle (float):                                          tracks angle for the indicator used in READY state
-        angle_direction (float):                                tracker for indicator (going left or right)
-        angle_cycle_speed (float):                              how fast the degrees are changing per frame
+        angle (int):                                            tracks angle (in degrees) for the indicator used in READY state
+        angle_direction (int):                                  tracker for indicator (going left or right)
+        angle_cycle_speed (int):                                how fast the degrees are changing per frame
         balls (list[Ball]):                                     contains list of active balls
         P (int):                                                contains the "weight" of each score object's contribution to points from stages.json file
         G (int):                                                contains the duration of the powerups (in seconds)
         X (int):                                                contains the % chance of a score object being a powerup
         Q (int):                                                contains the bonus point increment used in streak logic
-        stages (list[dict[str, list[dict[str, int]]]]):         contains all the predefined stages
+        stages (list[array[int]]):                              contains all the predefined stages as flat x, y, brick_type triples
         g (int):                                                redefined G to match fps
         bricks (list[Brick]):                                   contains all bricks loaded from a stage                                       
+        GRID_CELL_W (int):                                      width of a cell in the brick grid
+        GRID_CELL_H (int):                                      height of a cell in the brick grid
+        STAGES_CACHE_VERSION (int):                             format version of the pickled stages cache
+        _brick_grid (dict[tuple[int, int], list[int]]):         maps each grid cell to the indices of bricks overlapping it (used for collisions)
+        _breakable_bricks (int):                                no. of bricks left that can still be destroyed (stage is cleared at 0)
         score_objects (list[Reward]):                           contains all score objects that were generated
-        current_game_state (GameState):                         tracks the current game state
+        current_game_state (int):                               tracks the current game state (one of GameState)
         sound (Sounds):                                         sound player for sfx and bgm
         dropped_timer (float):                                  timer for DROPPED state
         transition_timer (float):                               timer for STAGE_TRANSITION state
@@ -90,6 +103,18 @@ class BreakoutGame:
         chosen_msg (str):                                       holds the chosen "message" from dropped_msgs
         streak_count(int):                                      tracks the no. of score objects continuously captured without dropping
         streak_timer(int):                                      tracks remaining duration for streak msg
+        _ready_text_xy (tuple[int, int]):                       (x, y) of the launch instruction in READY state
+        _launch_text_img (pyxel.Image):                         pre-rendered launch instruction (black is transparent)
+        _score_xy (tuple[int, int]):                            (x, y) of the score display
+        _play_button (tuple[int, int, int, int]):               (x, y, w, h) of the play button in START state
+        _game_over_blt (tuple[int, ...]):                       blt args of the "GAME OVER" sprite
+        _win_blt (tuple[int, ...]):                             blt args of the "YOU WIN" sprite
+        _play_again_text (tuple[int, int, str, int]):           text args of the play again instruction
+        _update_table (tuple[Callable[[], None], ...]):         update method of each game state (indexed by state)
+        _draw_table (tuple[Callable[[], None], ...]):           draw method of each game state (indexed by state)
+        _ui_cache (tuple[int, int]):                            (lives, score) the ui was last rendered for
+        _hearts_img (pyxel.Image):                              hearts for the current no. of lives
+        _score_text (str):                                      score text for the current score
         
     Methods:
         __init__(self) -> None:
@@ -99,9 +124,10 @@ class BreakoutGame:
             * class method
             Initializes pyxel engine.
 
-        _load_stages(cls, file_path: str) -> tuple[int, int, int, int, list[dict[str, list[dict[str, int]]]]]:     
+        _load_stages(cls, file_path: str) -> tuple[int, int, int, int, list[array[int]]]:     
             * class method
-            Reads the json file and returns data read.
+            Reads the json file and returns data read, with each stage packed into a flat array of x, y, brick_type triples.
+            The result is cached in a pickle file next to the json file and reused while it is newer than the json file.
 
             Args:
                 file_path (str):                                a string containing the path to the json file
@@ -109,6 +135,22 @@ class BreakoutGame:
         _next_stage(self) -> None:
             Transitions to next stage.
 
+        _grid_cells(cls, x: float, y: float, w: float, h: float) -> list[tuple[int, int]]:
+            * class method
+            Returns all grid cells overlapped by a bounding box.
+
+            Args:
+                x (float):                                      x-position of box (top-left corner)
+                y (float):                                      y-position of box (top-left corner)
+                w (float):                                      width of box
+                h (float):                                      height of box
+
+        _remove_brick(self, i: int) -> None:
+            Removes a brick from the stage and the brick grid by swapping it with the last brick.
+
+            Args:
+                i (int):                                        index of the brick to be removed
+
         _start_new_game(self) -> None:
             Starts a new game.
 
@@ -121,9 +163,6 @@ class BreakoutGame:
         _check_collision(self) -> None:
             Handles all collisions.
         
-        _check_input(self) -> None:
-            Handles user input (depending on the game state).
-        
         _spawn_score_objects(self, K: int, brick: Brick) -> None:
             Generates K score objects from the brick.
 
@@ -141,7 +180,7 @@ class BreakoutGame:
             Listens for play button to be pressed.
 
         _update_ready_state(self) -> None:
-            Handles indicator movement for launch and repositioning of ball to paddle.
+            Handles launching, indicator movement for launch, and repositioning of ball to paddle.
         
         _update_running_state(self) -> None:
             Handles ball and streak movement, collisions, and streaks.
@@ -151,6 +190,12 @@ class BreakoutGame:
 
         _update_stage_transition_state(self) -> None:
             Handles "stage transition" display and transitioning to next state.
+
+        _update_game_over_state(self) -> None:
+            Plays the game over sound and listens for a new game to be started.
+
+        _update_win_state(self) -> None:
+            Plays the win sound and listens for a new game to be started.
         
         _update_timers(self) -> None:
             Handles running of power up timers.
@@ -162,7 +207,7 @@ class BreakoutGame:
             Disables antigravity power up.
         
         _update(self) -> None:
-            Handles inputs and paddle movement by player, and which updates to run based on current game state.
+            Handles paddle movement by player, and which updates to run based on current game state.
         
         _draw_start_state(self) -> None:
             Draws a start screen with a play button.
@@ -205,9 +250,16 @@ class BreakoutGame:
         
         _draw_ui(self) -> None:
             Draws the current score and the no. of lives currently.
+
+        _bake_hearts(self) -> None:
+            Renders the hearts for the current no. of lives into an image.
         
+        _bake_background(cls) -> pyxel.Image:
+            * class method
+            Scales the background image in the resources file once into a screen-sized image.
+
         _draw_background(self) -> None:
-            Draws the background image in the resources file.
+            Draws the pre-scaled background image.
         
         _draw_streak(self) -> None:
             Displays the current streak no. and the added points.
@@ -217,22 +269,29 @@ class BreakoutGame:
         
     
     """
+    GRID_CELL_W: int = 32                                       # matches the widest brick
+    GRID_CELL_H: int = 16                                       # matches the brick height
+    STAGES_CACHE_VERSION: int = 2                               # bump when the cached stage format changes
+
     def __init__(self) -> None:
         """ Constructor """
         self._init_pyxel()                                      # initializes pyxel settings
+        self._background_img: pyxel.Image = self._bake_background()  # pre-scaled background
         self.gravity: float = 0.010
         self.paddle: Paddle = Paddle()                          # initializes a paddle
         self.original_paddle_speed: float = self.paddle.speed
         
         # relates to the indicator when game starts
-        self.angle: float                                       # angle tracker for indicator
-        self.angle_direction: float                             # 1 is left to right, -1 is right to left
-        self.angle_cycle_speed: float                           
+        self.angle: int                                         # angle tracker for indicator (indexes _COS and _SIN)
+        self.angle_direction: int                               # 1 is left to right, -1 is right to left
+        self.angle_cycle_speed: int                             
 
         self.balls: list[Ball] = [Ball(self.gravity)]           # initially puts a single ball inside list
         self._reset_ball()                                      # makes sure that ball starts at paddle 
 
         self.bricks: list[Brick] = []                           # tracks the list of bricks imported from the current stage
+        self._brick_grid: dict[tuple[int, int], list[int]] = {}    # buckets brick indices by grid cell for collision checks
+        self._breakable_bricks: int = 0                         # counts bricks left that are not indestructible
         self.score_objects: list[Reward] = []                   # tracks the list of score objects currently at play
 
         # relates to stage management
@@ -240,7 +299,7 @@ class BreakoutGame:
         self.g = self.G * 60                                    # redefines G (60 fps)
         self.current_stage: int                                 # tracks the current stage no. 
         
-        self.current_game_state: GameState                      # game state tracker
+        self.current_game_state: int                            # game state tracker (one of GameState)
         self.sound: Sounds = Sounds()                           # sound player
         self.dropped_timer: float = 0                           # timer for DROPPED state
         self.transition_timer: float = 0                        # timer for STAGE_TRANSITION state
@@ -261,6 +320,46 @@ class BreakoutGame:
         self.streak_count: int = 0
         self.streak_timer: int = 0
 
+        # static ui positions (computed once instead of every frame)
+        self._ready_text_xy: tuple[int, int] = (pyxel.width // 2 - 80, pyxel.height // 2)
+
+        # launch instruction rendered once (4x6 px per character in the default font)
+        launch_text = "Left Mouse Click or Space to Launch!"
+        self._launch_text_img: pyxel.Image = pyxel.Image(len(launch_text) * 4, 6)
+        self._launch_text_img.cls(pyxel.COLOR_BLACK)
+        self._launch_text_img.text(0, 0, launch_text, pyxel.COLOR_WHITE)
+        self._score_xy: tuple[int, int] = (pyxel.width - 50, 10)
+        self._play_button: tuple[int, int, int, int] = (pyxel.width // 2 - 30, pyxel.height // 2 + 50, 60, 15)
+        self._game_over_blt: tuple[int, ...] = (139, 80, 0, 48, 32, 176, 16, pyxel.COLOR_LIGHT_BLUE)   # (x, y, img, u, v, w, h, colkey)
+        self._win_blt: tuple[int, ...] = (168, 80, 0, 48, 48, 136, 16, pyxel.COLOR_LIGHT_BLUE)
+        self._play_again_text: tuple[int, int, str, int] = (175, 130, "Press Enter to Play Again.", pyxel.COLOR_BLACK)
+
+        # cached ui (re-rendered only when lives or score change)
+        self._ui_cache: tuple[int, int] = (-1, -1)
+        self._hearts_img: pyxel.Image
+        self._score_text: str
+
+        # per-state handlers (looked up once per frame instead of matching on the state)
+        # (order must match the values in GameState)
+        self._update_table: tuple[Callable[[], None], ...] = (
+            self._update_start_state,                           # START
+            self._update_ready_state,                           # READY
+            self._update_running_state,                         # RUNNING
+            self._update_dropped_state,                         # DROPPED
+            self._update_stage_transition_state,                # STAGE_TRANSITION
+            self._update_game_over_state,                       # GAME_OVER
+            self._update_win_state,                             # WIN
+        )
+        self._draw_table: tuple[Callable[[], None], ...] = (
+            self._draw_start_state,                             # START
+            self._draw_ready_state,                             # READY
+            self._draw_running_state,                           # RUNNING
+            self._draw_dropped_state,                           # DROPPED
+            self._draw_stage_transition_state,                  # STAGE_TRANSITION
+            self._draw_game_over_state,                         # GAME_OVER
+            self._draw_win_state,                               # WIN
+        )
+
         pyxel.run(update=self._update, draw=self._draw)                     # runs game loop
   
     @classmethod
@@ -273,19 +372,76 @@ class BreakoutGame:
     # +++++++++++++++++++++++++++++++++ STAGE MANAGEMENT +++++++++++++++++++++++++++++++++
 
     @classmethod
-    def _load_stages(cls, file_path: str) -> tuple[int, int, int, int, list[dict[str, list[dict[str, int]]]]]:
-        """ Load stages from JSON file """
+    def _load_stages(cls, file_path: str) -> tuple[int, int, int, int, list[array[int]]]:
+        """ Load stages from JSON file (or its pickled cache) """
+        cache_path = os.path.splitext(file_path)[0] + ".pkl"   # e.g. stages.json -> stages.pkl
+
+                                                                # uses the cache only if it is newer than the json file
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+                with open(cache_path, "rb") as f:
+                    version, result = pickle.load(f)
+                if version == cls.STAGES_CACHE_VERSION:         # ignores caches written in an older format
+                    return result
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass                                                # missing or broken cache, falls back to json
+
         with open(file_path, "r") as f:
             data = json.load(f)
-        return data["P"], data["G"], data["X"], data["Q"], data["stages"]
+                                                                # packs each stage as x, y, brick_type triples of 2-byte ints
+        stages = [
+            array("h", [value for brick in stage["bricks"] for value in (brick["x"], brick["y"], brick["brick_type"])])
+            for stage in data["stages"]
+        ]
+        result = data["P"], data["G"], data["X"], data["Q"], stages
+
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((cls.STAGES_CACHE_VERSION, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass                                                # read-only location (e.g. web build), skips caching
+        return result
 
     def _load_stage(self, stage_index: int) -> None:
         """ Load a specific stage """
-        stage = self.stages[stage_index]                        # stages is 0-indexed
+        # Note: bricks are still built fresh on every load since K and some skins are randomized per brick
+        values = iter(self.stages[stage_index])                 # stages is 0-indexed
         self.bricks = [
-            Brick(brick["x"], brick["y"], brick["brick_type"], K=pyxel.rndi(a=2,b=4))
-            for brick in stage["bricks"]
+            Brick(x, y, brick_type, K=pyxel.rndi(a=2,b=4))
+            for x, y, brick_type in zip(values, values, values)  # reads the flat array three values at a time
         ]
+        self._breakable_bricks = sum(1 for brick in self.bricks if brick.brick_type != 4)
+
+                                                                # bricks never move, so the grid is only built once per stage
+        self._brick_grid = {}
+        for i, brick in enumerate(self.bricks):
+            for cell in self._grid_cells(brick.x, brick.y, brick.w, brick.h):
+                self._brick_grid.setdefault(cell, []).append(i)
+
+    @classmethod
+    def _grid_cells(cls, x: float, y: float, w: float, h: float) -> list[tuple[int, int]]:
+        """ Returns the grid cells covered by a bounding box (edges included) """
+        return [
+            (col, row)
+            for col in range(int(x // cls.GRID_CELL_W), int((x + w) // cls.GRID_CELL_W) + 1)
+            for row in range(int(y // cls.GRID_CELL_H), int((y + h) // cls.GRID_CELL_H) + 1)
+        ]
+
+    def _remove_brick(self, i: int) -> None:
+        """ Removes a brick from the stage and the grid (swap-and-pop, so brick order is not kept) """
+        brick = self.bricks[i]
+        if brick.brick_type != 4:
+            self._breakable_bricks -= 1
+        for cell in self._grid_cells(brick.x, brick.y, brick.w, brick.h):
+            self._brick_grid[cell].remove(i)
+
+        last = self.bricks.pop()
+        last_i = len(self.bricks)                               # old index of the popped brick
+        if i != last_i:                                         # moves the last brick into the freed slot
+            self.bricks[i] = last
+            for cell in self._grid_cells(last.x, last.y, last.w, last.h):
+                bucket = self._brick_grid[cell]
+                bucket[bucket.index(last_i)] = i
 
     def _next_stage(self) -> None:
         """ Move to the next stage """
@@ -339,9 +495,8 @@ class BreakoutGame:
 
     def _launch_ball(self):
         """ Launches the ball based on the current angle """
-        angle_rad: float = radians(self.angle)
-        self.balls[0].speed_x = cos(angle_rad) * 2.5
-        self.balls[0].speed_y = -sin(angle_rad) * 2.5
+        self.balls[0].speed_x = _COS[self.angle] * 2.5
+        self.balls[0].speed_y = -_SIN[self.angle] * 2.5
 
         # transitions to running state
         self.current_game_state = GameState.RUNNING
@@ -355,8 +510,25 @@ class BreakoutGame:
                 self.sound.play_ball_hit_sound()
 
             # Ball vs Bricks
-            for i in reversed(range(len(self.bricks))):         # checks all bricks for collisions
+                                                                # only checks bricks sharing a grid cell with the ball's next position
+                                                                # ball's bounding box at its next position (computed once per ball)
+            ball_left = ball.x + ball.speed_x
+            ball_top = ball.y + ball.speed_y
+            ball_size = 2 * ball.r
+            ball_right = ball_left + ball_size
+            ball_bottom = ball_top + ball_size
+
+            candidates: list[int] = []
+            for cell in self._grid_cells(ball_left, ball_top, ball_size, ball_size):
+                for i in self._brick_grid.get(cell, ()):
+                    if i not in candidates:                     # a brick can span more than one cell
+                        candidates.append(i)
+
+            for i in candidates:
                 b: Brick = self.bricks[i]
+                                                                # skips bricks that only share a cell (same overlap test as detect_collision)
+                if ball_right < b.x or ball_left > b.x + b.w or ball_bottom < b.y or ball_top > b.y + b.h:
+                    continue
 
                 brick_collision = ball.detect_collision(b)
                 if brick_collision:
@@ -365,13 +537,13 @@ class BreakoutGame:
                     if ball.destroy_brick:
                         if b.brick_type == 5:                   # if it is a ball maker   
                             new_ball = Ball(self.gravity)       # new ball is made
-                            # angle in radians
-                            angle = radians(pyxel.rndi(a=0, b=360))
+                            # angle in degrees (indexes _COS and _SIN)
+                            angle = pyxel.rndi(a=0, b=360)
                             speed = pyxel.rndf(a=1,b=new_ball.MAX_SPEED)
 
                             # sets speed in the x and y direction
-                            new_ball.speed_x = speed * cos(angle)
-                            new_ball.speed_y = -speed * sin(angle)
+                            new_ball.speed_x = speed * _COS[angle]
+                            new_ball.speed_y = -speed * _SIN[angle]
 
                             # positions ball at the center of brick
                             new_ball.x = b.x + (b.w / 2)  
@@ -382,7 +554,7 @@ class BreakoutGame:
                         else:
                             # if not a ball maker, spawns K score objects
                             self._spawn_score_objects(b.K, b)
-                        del self.bricks[i]                      # removes collided with destructible bricks
+                        self._remove_brick(i)                   # removes collided with destructible bricks
                         ball.destroy_brick = False              # reset
                     break
     
@@ -411,20 +583,6 @@ class BreakoutGame:
                     self.streak_timer = 0                       # clears streak display
                 del self.score_objects[i]
                 
-    def _check_input(self) -> None:
-        """ Checks for inputs by user (depending on the game state)"""
-        if self.current_game_state == GameState.READY:
-             # press left mouse click or space bar to launch ball
-            if pyxel.btnp(key=pyxel.MOUSE_BUTTON_LEFT) or pyxel.btnp(key=pyxel.KEY_SPACE):
-                self.sound.play_launch_sound()
-                self._launch_ball()                             # launches the ball
-    
-        if self.current_game_state in {GameState.GAME_OVER, GameState.WIN}:
-            # press enter to start a new game
-            if pyxel.btnp(key=pyxel.KEY_RETURN): 
-                self._start_new_game()
-                pyxel.playm(msc=0, loop=True)                       # restarts background music
-
     def _spawn_score_objects(self, K: int, brick: Brick) -> None:
         """ Spawns K rectangular score objects within the bounds of a hit brick """
         
@@ -488,8 +646,7 @@ class BreakoutGame:
             mouse_x, mouse_y = pyxel.mouse_x, pyxel.mouse_y
 
                                                                 # checks if the mouse is within the Play button areas
-            button_x, button_y = pyxel.width // 2 - 30, pyxel.height // 2 + 50
-            button_width, button_height = 60, 15
+            button_x, button_y, button_width, button_height = self._play_button
 
             if button_x <= mouse_x <= button_x + button_width and button_y <= mouse_y <= button_y + button_height:
                 pyxel.mouse(visible=False) 
@@ -499,6 +656,12 @@ class BreakoutGame:
                 
     def _update_ready_state(self) -> None:
         """ Update logic for READY state """
+        # press left mouse click or space bar to launch ball
+        if pyxel.btnp(key=pyxel.MOUSE_BUTTON_LEFT) or pyxel.btnp(key=pyxel.KEY_SPACE):
+            self.sound.play_launch_sound()
+            self._launch_ball()                                 # launches the ball
+            return
+
         # repositions ball
         self.balls[0].x = self.paddle.x + self.paddle.w / 2 - self.balls[0].r
 
@@ -506,7 +669,7 @@ class BreakoutGame:
         self.angle += self.angle_direction * self.angle_cycle_speed
 
         # reverses direction at bounds
-        if self.angle == 180 or self.angle == 0:
+        if self.angle >= 180 or self.angle <= 0:
             self.angle_direction = -self.angle_direction        # reversed direction
     
     def _update_running_state(self) -> None:
@@ -525,7 +688,7 @@ class BreakoutGame:
         self._check_collision()                                 # checks for collisions
         
         # if all bricks cleared not including indestructible brick (stage cleared)
-        if not self.bricks or all(brick.brick_type == 4 for brick in self.bricks): 
+        if self._breakable_bricks == 0: 
             if not self.score_objects:                          # if there are no score objects in the screen
                 if hasattr(self, "antigravity_timer"):
                     self._disable_antigravity()
@@ -574,6 +737,20 @@ class BreakoutGame:
             self._reset_ball()
             self.current_game_state = GameState.READY
     
+    def _update_game_over_state(self) -> None:
+        """ Update logic for GAME_OVER state """
+        if pyxel.btnp(key=pyxel.KEY_RETURN):                    # press enter to start a new game
+            self._start_new_game()
+            return
+        self.sound.play_game_over_sound()
+
+    def _update_win_state(self) -> None:
+        """ Update logic for WIN state """
+        if pyxel.btnp(key=pyxel.KEY_RETURN):                    # press enter to start a new game
+            self._start_new_game()
+            return
+        self.sound.play_win_sound()
+
     def _update_timers(self) -> None:
         """ Update timers based on game state """
         if self.current_game_state == GameState.RUNNING:
@@ -597,24 +774,8 @@ class BreakoutGame:
 
     def _update(self) -> None:
         """ General update method """
-        self._check_input()
         self.paddle.update()
-
-        match self.current_game_state:
-            case GameState.START:
-                self._update_start_state()
-            case GameState.READY:
-                self._update_ready_state()
-            case GameState.RUNNING:
-                self._update_running_state()
-            case GameState.DROPPED:
-                self._update_dropped_state()
-            case GameState.STAGE_TRANSITION:
-                self._update_stage_transition_state()
-            case GameState.GAME_OVER:
-                self.sound.play_game_over_sound()
-            case GameState.WIN:
-                self.sound.play_win_sound()
+        self._update_table[self.current_game_state]()           # runs the update method of the current state
 
 # +++++++++++++++++++++++++++++++++ DRAW METHODS +++++++++++++++++++++++++++++++++
     def _draw_start_state(self) -> None:
@@ -634,8 +795,7 @@ class BreakoutGame:
         )
 
                                                                 # play button
-        button_x, button_y = pyxel.width // 2 - 30, pyxel.height // 2 + 50
-        button_width, button_height = 60, 15
+        button_x, button_y, button_width, button_height = self._play_button
         # format: (bg, text)
         button_color_bg_text: tuple[int, int] = (pyxel.COLOR_RED, pyxel.COLOR_WHITE) 
         
@@ -659,15 +819,16 @@ class BreakoutGame:
         self._draw_ui()                                         # draws the ui
 
 
-        angle_rad = radians(self.angle)
         indicator_length = 25  
-        x_end = self.paddle.x + self.paddle.w / 2 + indicator_length * cos(angle_rad) 
-        y_end = self.paddle.y - indicator_length * sin(angle_rad) 
+        px_mid = self.paddle.x + self.paddle.w * 0.5           # paddle center (start of the indicator)
+        py = self.paddle.y
+        x_end = px_mid + indicator_length * _COS[self.angle] 
+        y_end = py - indicator_length * _SIN[self.angle] 
 
                                                                 # draws the indicator line
         pyxel.line(
-            x1=self.paddle.x + self.paddle.w / 2,
-            y1=self.paddle.y,
+            x1=px_mid,
+            y1=py,
             x2=x_end,
             y2=y_end,
             col=pyxel.COLOR_WHITE
@@ -677,12 +838,15 @@ class BreakoutGame:
 
                                                                 # adds blinking text instruction
         if (pyxel.frame_count // 30) % 2 == 0:                  # toggles every 30 frames  
-            pyxel.text(
-                x=pyxel.width // 2 - 80,  
-                y=pyxel.height // 2,  
-                s="Left Mouse Click or Space to Launch!",
-                col=pyxel.COLOR_WHITE,
-                font=None
+            pyxel.blt(
+                x=self._ready_text_xy[0],  
+                y=self._ready_text_xy[1],  
+                img=self._launch_text_img,
+                u=0,
+                v=0,
+                w=self._launch_text_img.width,
+                h=self._launch_text_img.height,
+                colkey=pyxel.COLOR_BLACK
             )
         
     def _draw_running_state(self) -> None:
@@ -734,22 +898,22 @@ class BreakoutGame:
         """ Draws the GAME_OVER state """
         
                                                                 # "GAME OVER" text
-        pyxel.blt(x=139, y=80, img=0, u=48, v=32, w=176, h=16, colkey=pyxel.COLOR_LIGHT_BLUE, scale=2)
-        pyxel.text(x=175, y=130, s="Press Enter to Play Again.", col=pyxel.COLOR_BLACK, font=None)
+        pyxel.blt(*self._game_over_blt, scale=2)
+        pyxel.text(*self._play_again_text)
                                                                 # displays score
         pyxel.text(x=208, y=120,s=f"Score: {self.stats.score}", col=pyxel.COLOR_BLACK, font=None)
     
     def _draw_win_state(self) -> None:
         """ Draws the WIN state """
                                                                 # "YOU WIN" text
-        pyxel.blt(x=168, y=80, img=0, u=48, v=48, w=136, h=16, colkey=pyxel.COLOR_LIGHT_BLUE, scale=2)
-        pyxel.text(x=175, y=130, s="Press Enter to Play Again.", col=pyxel.COLOR_BLACK, font=None)
+        pyxel.blt(*self._win_blt, scale=2)
+        pyxel.text(*self._play_again_text)
                                                                 # displays final score
         pyxel.text(x=208, y=120,s=f"Score: {self.stats.score}", col=pyxel.COLOR_BLACK, font=None) 
         
     def _draw_powerup_timers(self) -> None:
         """ Draws the timers for active power-ups """
-        if self.current_game_state in {GameState.READY, GameState.RUNNING}:
+        if self.current_game_state in (GameState.READY, GameState.RUNNING):
             x, y = 10, 60                                       # starting position for the first timer
             width, height = 60, 6                               # dimensions of the timer bar         
 
@@ -823,33 +987,59 @@ class BreakoutGame:
 
     def _draw_ui(self) -> None:
         """ Draw UI elements like score and lives """
-        heart_x: float = 10                                     # starting pos for hearts
-        heart_y: float = 10  
-        heart_spacing: float = 12                               # spacing between each heart
+        key = (self.stats.lives, self.stats.score)
+        if key != self._ui_cache:                               # only re-renders the ui when lives or score changed
+            if key[0] != self._ui_cache[0]:
+                self._bake_hearts()
+            self._score_text = f"Score: {self.stats.score}"
+            self._ui_cache = key
+
+                                                                # draws hearts for lives (single blt of the baked image)
+        if self.stats.lives > 0:
+            pyxel.blt(
+                x=10,
+                y=10,
+                img=self._hearts_img,
+                u=0,
+                v=0,
+                w=self._hearts_img.width,
+                h=self._hearts_img.height,
+                colkey=pyxel.COLOR_ORANGE
+            )
+                                                                # draws score
+        pyxel.text(x=self._score_xy[0], y=self._score_xy[1], s=self._score_text, col=pyxel.COLOR_BLACK, font=None)
+
+    def _bake_hearts(self) -> None:
+        """ Renders one heart per life into an image so the ui can draw them with one blt """
+        heart_spacing: int = 12                                 # spacing between each heart
         row_limit: int = 8                                      # max hearts per row
+        lives = max(1, self.stats.lives)
 
-                                                                # draws hearts for lives
+        rows = (lives - 1) // row_limit + 1
+        cols = min(lives, row_limit)
+        img = pyxel.Image((cols - 1) * heart_spacing + 16, (rows - 1) * heart_spacing + 16)
+        img.cls(pyxel.COLOR_ORANGE)                             # orange is keyed out when drawn to the screen
+
+        blt = img.blt                                           # local lookup inside the loop
         for i in range(self.stats.lives):
-            x = heart_x + (i % row_limit) * heart_spacing       
-            y = heart_y + (i // row_limit) * heart_spacing      
-            pyxel.blt(
-                x=x,  
-                y=y,  
-                img=0,  
-                u=0,  
-                v=0,  
-                w=16,  
-                h=16,  
-                colkey=pyxel.COLOR_ORANGE  
+            row, col = divmod(i, row_limit)
+            blt(
+                x=col * heart_spacing,
+                y=row * heart_spacing,
+                img=0,
+                u=0,
+                v=0,
+                w=16,
+                h=16,
+                colkey=pyxel.COLOR_ORANGE
             )
-                                                                # draws score
-        pyxel.text(x=pyxel.width - 50, y=10, s=f"Score: {self.stats.score}", col=pyxel.COLOR_BLACK, font=None)
+        self._hearts_img = img
     
-    def _draw_background(self) -> None:
-        """ Draws the background """
-        
-                                                                # draws background image
-        pyxel.blt(
+    @classmethod
+    def _bake_background(cls) -> pyxel.Image:
+        """ Scales the background once so it can be drawn without scaling every frame """
+        img = pyxel.Image(pyxel.width, pyxel.height)
+        img.blt(
             x=113,
             y=32,
             img=2,
@@ -859,6 +1049,21 @@ class BreakoutGame:
             h=112,
             scale=2.005
         )
+        return img
+
+    def _draw_background(self) -> None:
+        """ Draws the background """
+        
+                                                                # draws background image (already scaled)
+        pyxel.blt(
+            x=0,
+            y=0,
+            img=self._background_img,
+            u=0,
+            v=0,
+            w=pyxel.width,
+            h=pyxel.height
+        )
     
     def _draw_streak(self) -> None:
         """ Draws impact of each score object received """
@@ -880,20 +1085,6 @@ class BreakoutGame:
     def _draw(self) -> None:
         """ General drawing method """
         self._draw_background()
-        match self.current_game_state:
-            case GameState.START:
-                self._draw_start_state()
-            case GameState.READY:
-                self._draw_ready_state()
-            case GameState.RUNNING:
-                self._draw_running_state()
-            case GameState.DROPPED:
-                self._draw_dropped_state()
-            case GameState.STAGE_TRANSITION:
-                self._draw_stage_transition_state()
-            case GameState.GAME_OVER:
-                self._draw_game_over_state()
-            case GameState.WIN:
-                self._draw_win_state()
+        self._draw_table[self.current_game_state]()             # runs the draw method of the current state
         
 BreakoutGame() # game call
@@ -41,6 +41,11 @@ class Paddle:
             Renders paddle and marker sprites.
             
     """
+    __slots__ = (
+        "w", "h", "x", "y", "sprite_img", "sprite_u", "sprite_v", "speed", "mark_w", "mark_h",
+        "mark_u", "mark_v",
+    )
+
     def __init__(self) -> None:
         """ Constructor for paddle """
         self.w: float = 72                                  # width of the paddle (based on sprite)
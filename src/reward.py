@@ -57,6 +57,10 @@ class Reward:
             Renders reward with the appropriate sprite.
 
     """
+    __slots__ = (
+        "x", "y", "w", "h", "accel", "speed_y", "P", "powerup_type", "is_powerup", "sprites",
+    )
+
     
     def __init__(self, x: float, y: float, points: int, falling_accel: float, X: int, powerup_type: str = "") -> None:
         """ Constructor for Score Object """